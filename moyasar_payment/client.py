@@ -0,0 +1,146 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .constants import CLIENT_IDLE_TIMEOUT, CONCURRENCY_WAIT_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimitExceeded(requests.exceptions.RequestException):
+    """Raised when a channel has no free request slot within the wait timeout."""
+
+
+class MoyasarClient:
+    """Pooled HTTP client used by a single channel.
+
+    Every channel gets its own connection pool and its own cap on in-flight
+    requests, so heavy traffic on one channel cannot exhaust the connections
+    available to another. The cap is enforced per process: with several
+    worker processes a channel can have up to ``max_connections`` requests in
+    flight in each of them.
+
+    A caller that finds the channel saturated waits at most
+    ``CONCURRENCY_WAIT_TIMEOUT`` seconds and then fails fast, so a busy
+    channel cannot tie up the shared worker threads serving other channels.
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        connect_timeout: float,
+        read_timeout: float,
+    ):
+        self.max_connections = max_connections
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_connections,
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._retired = False
+        self.last_used = time.monotonic()
+
+    @property
+    def settings(self) -> Tuple[int, float, float]:
+        return (self.max_connections, *self.timeout)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        if not self._slots.acquire(timeout=CONCURRENCY_WAIT_TIMEOUT):
+            raise ConcurrencyLimitExceeded(
+                f"No free Moyasar connection slot after {CONCURRENCY_WAIT_TIMEOUT}s"
+            )
+        with self._lock:
+            self._in_flight += 1
+        try:
+            kwargs.setdefault("timeout", self.timeout)
+            return self.session.post(url, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self.last_used = time.monotonic()
+                close = self._retired and self._in_flight == 0
+            self._slots.release()
+            if close:
+                self.session.close()
+
+    def is_idle(self, now: float) -> bool:
+        with self._lock:
+            return (
+                self._in_flight == 0 and now - self.last_used >= CLIENT_IDLE_TIMEOUT
+            )
+
+    def retire(self):
+        """Close the session now, or after the last in-flight request ends."""
+        with self._lock:
+            self._retired = True
+            close = self._in_flight == 0
+        if close:
+            self.session.close()
+
+    def close(self):
+        self.session.close()
+
+
+_clients: Dict[Optional[str], MoyasarClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _release_idle_clients(now: float):
+    for channel_slug, client in list(_clients.items()):
+        if client.is_idle(now):
+            del _clients[channel_slug]
+            client.retire()
+            logger.debug("Released idle Moyasar client for channel %s", channel_slug)
+
+
+def get_client(
+    channel_slug: Optional[str],
+    max_connections: int,
+    connect_timeout: float,
+    read_timeout: float,
+) -> MoyasarClient:
+    """Return the client for the channel, creating it on first use.
+
+    There is one client per channel. When the channel's settings change the
+    client is replaced and the old one is closed once its in-flight requests
+    finish; until then those requests still hold slots of the old client, so
+    the channel may briefly exceed its new ``max_connections``.
+
+    Idle clients are released lazily, on the next ``get_client`` call for any
+    channel. If all traffic stops, pooled connections stay open until then.
+    """
+    settings = (max_connections, connect_timeout, read_timeout)
+    now = time.monotonic()
+    with _clients_lock:
+        _release_idle_clients(now)
+        client = _clients.get(channel_slug)
+        if client is not None and client.settings != settings:
+            client.retire()
+            client = None
+        if client is None:
+            client = MoyasarClient(
+                max_connections=max_connections,
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+            )
+            _clients[channel_slug] = client
+        client.last_used = now
+        return client
+
+
+def clear_clients():
+    with _clients_lock:
+        for client in _clients.values():
+            client.retire()
+        _clients.clear()
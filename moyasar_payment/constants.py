@@ -2,3 +2,9 @@ from django.utils.translation import gettext_lazy as _
 
 MOYASAR_API_BASE_URL = "https://api.moyasar.com/v1"  # Moyasar API endpoint
 GATEWAY_NAME = str(_("Moyasar Payment Gateway"))
+
+DEFAULT_MAX_CONNECTIONS = 10  # Concurrent requests allowed per channel
+DEFAULT_CONNECT_TIMEOUT = 5  # Seconds to wait for a connection to Moyasar
+DEFAULT_READ_TIMEOUT = 30  # Seconds to wait for a response from Moyasar
+CONCURRENCY_WAIT_TIMEOUT = 0.5  # Seconds to wait for a free per-channel slot
+CLIENT_IDLE_TIMEOUT = 300  # Seconds before an unused channel client is released
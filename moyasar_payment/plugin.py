@@ -1,4 +1,5 @@
 import logging
+import math
 
 import requests
 from django.core.exceptions import ValidationError
@@ -17,7 +18,14 @@ from saleor.plugins.models import PluginConfiguration
 logger = logging.getLogger(__name__)
 
 import requests
-from .constants import MOYASAR_API_BASE_URL, GATEWAY_NAME
+from .client import get_client
+from .constants import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_READ_TIMEOUT,
+    GATEWAY_NAME,
+    MOYASAR_API_BASE_URL,
+)
 from saleor.payment import TransactionKind
 from checkout_payment.utils import (
     handle_webhook,
@@ -32,7 +40,7 @@ import base64
 class MoyasarPaymentPlugin(BasePlugin):
     PLUGIN_NAME = GATEWAY_NAME
     PLUGIN_ID = "moyasar_payment"
-    CONFIGURATION_PER_CHANNEL = False
+    CONFIGURATION_PER_CHANNEL = True
 
     DEFAULT_CONFIGURATION = [
         {
@@ -44,6 +52,9 @@ class MoyasarPaymentPlugin(BasePlugin):
             "value": "sk_test_9FcaoMeU3FUB787UJq7fP68TnzP4xaeq2amiVFFq",
         },
         {"name": "supported_currencies", "value": "SAR"},
+        {"name": "max_connections", "value": str(DEFAULT_MAX_CONNECTIONS)},
+        {"name": "connect_timeout", "value": str(DEFAULT_CONNECT_TIMEOUT)},
+        {"name": "read_timeout", "value": str(DEFAULT_READ_TIMEOUT)},
     ]
 
     CONFIG_STRUCTURE = {
@@ -62,6 +73,30 @@ class MoyasarPaymentPlugin(BasePlugin):
             "help_text": "Supported Currencies for Moyasar",
             "label": "Supported Currencies",
         },
+        "max_connections": {
+            "type": ConfigurationTypeField.STRING,
+            "help_text": (
+                "Maximum number of concurrent requests this channel can send "
+                "to Moyasar"
+            ),
+            "label": "Max connections",
+        },
+        "connect_timeout": {
+            "type": ConfigurationTypeField.STRING,
+            "help_text": "Seconds to wait for a connection to Moyasar",
+            "label": "Connect timeout",
+        },
+        "read_timeout": {
+            "type": ConfigurationTypeField.STRING,
+            "help_text": "Seconds to wait for a response from Moyasar",
+            "label": "Read timeout",
+        },
+    }
+
+    POSITIVE_NUMBER_FIELDS = {
+        "max_connections": (int, DEFAULT_MAX_CONNECTIONS),
+        "connect_timeout": (float, DEFAULT_CONNECT_TIMEOUT),
+        "read_timeout": (float, DEFAULT_READ_TIMEOUT),
     }
 
     def __init__(self, *args, **kwargs):
@@ -76,10 +111,51 @@ class MoyasarPaymentPlugin(BasePlugin):
             },
             supported_currencies=configuration["supported_currencies"],
         )
+        self.max_connections = self._get_number_or_default(
+            configuration, "max_connections"
+        )
+        self.connect_timeout = self._get_number_or_default(
+            configuration, "connect_timeout"
+        )
+        self.read_timeout = self._get_number_or_default(configuration, "read_timeout")
+
+    @classmethod
+    def _get_number(cls, configuration, field):
+        """Return the field as a positive finite number or raise ValueError."""
+        cast, default = cls.POSITIVE_NUMBER_FIELDS[field]
+        value = configuration.get(field)
+        if value in (None, ""):
+            return default
+        number = cast(value)
+        if not math.isfinite(number) or number <= 0:
+            raise ValueError(f"{field} must be a positive number, got {value!r}")
+        return number
+
+    def _get_number_or_default(self, configuration, field):
+        try:
+            return self._get_number(configuration, field)
+        except (TypeError, ValueError):
+            default = self.POSITIVE_NUMBER_FIELDS[field][1]
+            logger.warning(
+                "Invalid %s value for Moyasar plugin, using default %s.",
+                field,
+                default,
+            )
+            return default
 
     def _get_gateway_config(self):
         return self.config
 
+    def _get_client(self):
+        # The client is looked up on every call rather than stored on the
+        # instance, because the plugin manager recreates plugins per request.
+        return get_client(
+            channel_slug=self.channel.slug if self.channel else None,
+            max_connections=self.max_connections,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+        )
+
     @classmethod
     def validate_plugin_configuration(cls, plugin_configuration: "PluginConfiguration"):
         """Validate if provided configuration is correct."""
@@ -107,6 +183,24 @@ class MoyasarPaymentPlugin(BasePlugin):
                 },
             )
 
+        invalid_fields = []
+        for field in cls.POSITIVE_NUMBER_FIELDS:
+            try:
+                cls._get_number(configuration, field)
+            except (TypeError, ValueError):
+                invalid_fields.append(field)
+
+        if invalid_fields:
+            raise ValidationError(
+                {
+                    f"{field}": ValidationError(
+                        "This field must be a positive number.",
+                        code=PluginErrorCode.INVALID.value,
+                    )
+                    for field in invalid_fields
+                },
+            )
+
     def get_client_token(self):
         return self.config.connection_params.get("public_key")
 
@@ -153,7 +247,7 @@ class MoyasarPaymentPlugin(BasePlugin):
             }
 
             try:
-                response = requests.post(
+                response = self._get_client().post(
                     f"{MOYASAR_API_BASE_URL}/payments",
                     headers=headers,
                     json=apple_pay_data,
@@ -191,7 +285,7 @@ class MoyasarPaymentPlugin(BasePlugin):
             }
 
             try:
-                response = requests.post(
+                response = self._get_client().post(
                     f"{MOYASAR_API_BASE_URL}/payments",
                     headers=headers,
                     json=payment_data,
@@ -256,7 +350,7 @@ class MoyasarPaymentPlugin(BasePlugin):
             "Content-Type": "application/json",
         }
         try:
-            response = requests.post(
+            response = self._get_client().post(
                 f"{MOYASAR_API_BASE_URL}/payments/{payment_id}/capture",
                 headers=headers,
                 json={},
@@ -310,7 +404,7 @@ class MoyasarPaymentPlugin(BasePlugin):
             "Content-Type": "application/json",
         }
         try:
-            response = requests.post(
+            response = self._get_client().post(
                 f"{MOYASAR_API_BASE_URL}/payments/{payment_id}/refund",
                 headers=headers,
                 json={},
@@ -363,7 +457,7 @@ class MoyasarPaymentPlugin(BasePlugin):
             "Content-Type": "application/json",
         }
         try:
-            response = requests.post(
+            response = self._get_client().post(
                 f"{MOYASAR_API_BASE_URL}/payments/{payment_id}/confirm",
                 headers=headers,
                 json={},
@@ -1,5 +1,17 @@
+import threading
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
+
+from django.core.exceptions import ValidationError
+
+from .moyasar_payment import client as client_module
+from .moyasar_payment import plugin as plugin_module
+from .moyasar_payment.client import (
+    ConcurrencyLimitExceeded,
+    clear_clients,
+    get_client,
+)
 from .moyasar_payment.plugin import MoyasarPaymentPlugin
 
 
@@ -12,17 +24,20 @@ class TestMoyasarPaymentPlugin(unittest.TestCase):
             "description": "Order #123 Payment",
         }
 
-    @patch("requests.post")
-    def test_process_payment_success(self, mock_post):
+    @patch.object(plugin_module, "get_client")
+    def test_process_payment_success(self, mock_get_client):
+        mock_post = mock_get_client.return_value.post
         mock_response = mock_post.return_value
         mock_response.status_code = 200
 
         result = self.plugin.process_payment(self.payment_data, None)
 
+        mock_post.assert_called_once()
         self.assertEqual(result, "confirmed")
 
-    @patch("requests.post")
-    def test_process_payment_failure(self, mock_post):
+    @patch.object(plugin_module, "get_client")
+    def test_process_payment_failure(self, mock_get_client):
+        mock_post = mock_get_client.return_value.post
         mock_response = mock_post.return_value
         mock_response.status_code = 500
 
@@ -30,17 +45,20 @@ class TestMoyasarPaymentPlugin(unittest.TestCase):
 
         self.assertEqual(result, "failed")
 
-    @patch("requests.post")
-    def test_capture_payment_success(self, mock_post):
+    @patch.object(plugin_module, "get_client")
+    def test_capture_payment_success(self, mock_get_client):
+        mock_post = mock_get_client.return_value.post
         mock_response = mock_post.return_value
         mock_response.status_code = 200
 
         result = self.plugin.capture_payment({"payment_id": "mock_payment_id"}, None)
 
+        mock_post.assert_called_once()
         self.assertEqual(result, "captured")
 
-    @patch("requests.post")
-    def test_capture_payment_failure(self, mock_post):
+    @patch.object(plugin_module, "get_client")
+    def test_capture_payment_failure(self, mock_get_client):
+        mock_post = mock_get_client.return_value.post
         mock_response = mock_post.return_value
         mock_response.status_code = 500
 
@@ -49,5 +67,111 @@ class TestMoyasarPaymentPlugin(unittest.TestCase):
         self.assertEqual(result, "failed")
 
 
+class TestMoyasarClient(unittest.TestCase):
+    def tearDown(self):
+        clear_clients()
+
+    def test_client_is_reused_within_channel(self):
+        client = get_client("channel-a", 5, 5.0, 30.0)
+
+        self.assertIs(client, get_client("channel-a", 5, 5.0, 30.0))
+
+    def test_channels_get_isolated_clients(self):
+        client_a = get_client("channel-a", 5, 5.0, 30.0)
+        client_b = get_client("channel-b", 5, 5.0, 30.0)
+
+        self.assertIsNot(client_a, client_b)
+        self.assertIsNot(client_a.session, client_b.session)
+
+    @patch.object(client_module, "CLIENT_IDLE_TIMEOUT", 0)
+    def test_idle_client_is_released(self):
+        client = get_client("channel-a", 5, 5.0, 30.0)
+
+        self.assertIsNot(client, get_client("channel-a", 5, 5.0, 30.0))
+
+    def test_client_is_replaced_when_settings_change(self):
+        client = get_client("channel-a", 5, 5.0, 30.0)
+
+        new_client = get_client("channel-a", 2, 5.0, 30.0)
+
+        self.assertIsNot(client, new_client)
+        self.assertEqual(new_client.max_connections, 2)
+
+    def test_default_timeout_is_forwarded(self):
+        client = get_client("channel-a", 5, 5.0, 30.0)
+
+        with patch.object(client.session, "post") as mock_post:
+            client.post("https://example.com", json={})
+
+        mock_post.assert_called_once_with(
+            "https://example.com", json={}, timeout=(5.0, 30.0)
+        )
+
+    @patch.object(client_module, "CONCURRENCY_WAIT_TIMEOUT", 0)
+    def test_saturated_channel_does_not_starve_other_channel(self):
+        busy_client = get_client("channel-a", 2, 5.0, 30.0)
+        other_client = get_client("channel-b", 2, 5.0, 30.0)
+        release = threading.Event()
+        started = threading.Barrier(3)
+
+        def slow_post(*args, **kwargs):
+            started.wait()
+            release.wait()
+
+        threads = [
+            threading.Thread(target=busy_client.post, args=("https://example.com",))
+            for _ in range(2)
+        ]
+        with patch.object(busy_client.session, "post", side_effect=slow_post):
+            for thread in threads:
+                thread.start()
+            started.wait()
+            try:
+                with self.assertRaises(ConcurrencyLimitExceeded):
+                    busy_client.post("https://example.com")
+
+                with patch.object(other_client.session, "post") as mock_post:
+                    other_client.post("https://example.com")
+                mock_post.assert_called_once()
+            finally:
+                release.set()
+                for thread in threads:
+                    thread.join()
+
+
+class TestValidatePluginConfiguration(unittest.TestCase):
+    def _plugin_configuration(self, **overrides):
+        values = {
+            "public_api_key": "pk_test",
+            "secret_api_key": "sk_test",
+            "supported_currencies": "SAR",
+            "max_connections": "10",
+            "connect_timeout": "5",
+            "read_timeout": "30",
+            **overrides,
+        }
+        return SimpleNamespace(
+            active=True,
+            configuration=[
+                {"name": name, "value": value} for name, value in values.items()
+            ],
+        )
+
+    def test_valid_configuration(self):
+        MoyasarPaymentPlugin.validate_plugin_configuration(
+            self._plugin_configuration()
+        )
+
+    def test_invalid_numbers_are_rejected(self):
+        for field in ["max_connections", "connect_timeout", "read_timeout"]:
+            for value in ["0", "-1", "abc", "nan", "inf"]:
+                with self.subTest(field=field, value=value):
+                    with self.assertRaises(ValidationError) as ctx:
+                        MoyasarPaymentPlugin.validate_plugin_configuration(
+                            self._plugin_configuration(**{field: value})
+                        )
+                    self.assertIn(field, ctx.exception.error_dict)
+
+
 if __name__ == "__main__":
     unittest.main()